@@ -2,28 +2,46 @@
 Main application module for the Markdown Viewer.
 """
 
-import tempfile
-import webbrowser
+import atexit
+import bisect
+import hashlib
+import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, Markdown, Static, DirectoryTree, Input, Tree
 from textual.containers import VerticalScroll, Horizontal
 from textual.reactive import reactive
 from textual.events import Key
+from textual.timer import Timer
 from rich.text import Text
-from rich.markup import escape
 
 from .constants import (
     APP_NAME,
     DEFAULT_CONTENT,
     NOTIFICATION_DURATION,
     EXPORT_DIALOG_DURATION,
+    SEARCH_DEBOUNCE_DELAY,
+    FILE_RELOAD_DEBOUNCE_DELAY,
+    FILE_SELECT_DEBOUNCE_DELAY,
     SEARCH_PLACEHOLDER,
-    SEARCH_NO_MATCHES_PLACEHOLDER
+    SEARCH_NO_MATCHES_PLACEHOLDER,
+    HTML_ESCAPE_TABLE,
+    RENDERED_HTML_HEAD,
+    RENDERED_HTML_TAIL,
+    RAW_HTML_HEAD,
+    RAW_HTML_TAIL
+)
+from .ui import (
+    APP_CSS,
+    APP_BINDINGS,
+    CURRENT_MATCH_STYLE,
+    MarkdownTree,
+    UIHelper,
+    coalesce_matches
 )
-from .ui import APP_CSS, APP_BINDINGS, UIHelper
 from .services import (
     FileManager,
     FileWatcher,
@@ -66,54 +84,87 @@ class MarkdownViewerApp(App):
         
         # Application state
         self.markdown_content = ""
+        self._md_cache: Optional[Tuple[int, str]] = None
+        self._html_cache: Optional[Tuple[int, str]] = None
+        self._toc_fingerprint: Optional[bytes] = None
+        self._raw_text_cache: Optional[Tuple[int, Text]] = None
+        self._styled_raw_cache: Optional[Tuple[Tuple[int, int], Text]] = None
+        self._line_starts_cache: Optional[Tuple[int, List[int]]] = None
+        self._md_segments_cache: Optional[Tuple[Tuple[int, int], List[str]]] = None
+        self._html_doc_cache: Optional[
+            Tuple[Tuple[bool, int, str], Tuple[bytes, bytes, bytes]]
+        ] = None
+        self._last_highlight_key: Optional[Tuple[int, int, int, bool]] = None
+        self._last_title_key: Optional[Tuple[str, bool, bool]] = None
+        self._last_md_push: Optional[int] = None
+        self._search_timer: Optional[Timer] = None
+        self._pending_search: Optional[str] = None
+        self._reload_timer: Optional[Timer] = None
+        self._select_timer: Optional[Timer] = None
+        self._pending_selection: Optional[Path] = None
         self._export_html_path: Optional[Path] = None
+        self._tmp_html_path: Optional[str] = None
+        self._last_written_sig: Optional[Tuple[bool, int, str]] = None
+        self._markdown_dirty = False
+        # The raw Static composes empty (no second copy of the document
+        # at startup), so it starts dirty and fills on first toggle
+        self._raw_dirty = True
+
+        # Lazily mounted panels (created on first toggle)
+        self._file_tree: Optional[DirectoryTree] = None
+        self._toc_panel: Optional[VerticalScroll] = None
+        self._toc_tree: Optional[Tree] = None
         self._original_content: Optional[str] = None
         self._original_path: Optional[Path] = None
         
-        # Load initial file if provided
-        if markdown_path:
-            self._load_initial_file(markdown_path)
-        else:
-            self.markdown_content = DEFAULT_CONTENT
+        # The initial file is read in a worker once the app has mounted so
+        # startup isn't blocked on disk I/O for large documents
+        self._initial_path = markdown_path
+        if not markdown_path:
+            self._set_content(DEFAULT_CONTENT)
 
     def compose(self) -> ComposeResult:
         """Compose the application UI."""
         yield Header(show_clock=True)
-        
+
+        # The input starts hidden; keep it out of the focus chain so it
+        # can't swallow the app key bindings before search is opened
+        search_input = Input(placeholder=SEARCH_PLACEHOLDER, id="search-input")
+        search_input.can_focus = False
+        yield search_input
+
         with Horizontal(id="main-container"):
-            # File tree panel
-            yield DirectoryTree(
-                Path.cwd(),
-                id="file-tree"
-            )
-            
+            # The file tree and TOC panels are mounted lazily on first
+            # toggle (see watch_show_file_tree/watch_show_toc)
+
             # Main content area
             with VerticalScroll(id="content-area"):
                 yield Markdown(self.markdown_content, id="markdown-view")
-                yield Static(self.markdown_content, id="raw-view")
-            
-            # Table of contents panel
-            with VerticalScroll(id="toc-panel"):
-                yield Tree("Table of Contents", id="toc-tree")
-        
+                yield Static("", id="raw-view", markup=False)
+
         yield Footer()
 
     def on_mount(self) -> None:
         """Initialize the view state when the app mounts."""
+        # Resolve frequently used widgets once; query_one walks the DOM on
+        # every call and these are hit on each keystroke/reactive update
+        self._markdown_view = self.query_one("#markdown-view", Markdown)
+        self._raw_view = self.query_one("#raw-view", Static)
+        self._content_area = self.query_one("#content-area", VerticalScroll)
+        self._main_container = self.query_one("#main-container", Horizontal)
+        self._search_input = self.query_one("#search-input", Input)
+
         self._update_view()
         self._update_header_title()
         self._build_table_of_contents()
-        
-        # Start file watching if we have a file
-        if self.file_manager.current_file:
-            self.file_watcher.start(self.file_manager.current_file)
-        
+
+        # Kick off the deferred initial load (the worker starts the file
+        # watcher once the read completes)
+        if self._initial_path:
+            self._load_markdown_file(self._initial_path)
+
         # Focus the main content area
         self._focus_content_area()
-        
-        # Process markdown for Mermaid diagrams
-        if not self.show_raw:
-            self._update_markdown_view()
 
     def on_unmount(self) -> None:
         """Clean up when the app exits."""
@@ -122,26 +173,41 @@ class MarkdownViewerApp(App):
     # Reactive watchers
     def watch_show_raw(self, show_raw: bool) -> None:
         """React to changes in the show_raw state."""
-        self._update_view()
-        self._update_header_title()
-        if self.search_engine.search_term:
-            self._update_search_highlights()
+        with self.batch_update():
+            self._update_view()
+            self._update_header_title()
+            if self.search_engine.search_term:
+                self._update_search_highlights()
 
     def watch_show_file_tree(self, show_file_tree: bool) -> None:
         """React to changes in the show_file_tree state."""
-        file_tree = self.query_one("#file-tree")
+        if show_file_tree and self._file_tree is None:
+            # First toggle: mount the tree now so startup never pays for
+            # enumerating the working directory
+            self._file_tree = MarkdownTree(Path.cwd(), id="file-tree")
+            self._main_container.mount(self._file_tree, before=self._content_area)
+        if self._file_tree is None:
+            return
         if show_file_tree:
-            file_tree.add_class("visible")
+            self._file_tree.add_class("visible")
         else:
-            file_tree.remove_class("visible")
+            self._file_tree.remove_class("visible")
 
     def watch_show_toc(self, show_toc: bool) -> None:
         """React to changes in the show_toc state."""
-        toc_panel = self.query_one("#toc-panel")
+        if show_toc and self._toc_panel is None:
+            # First toggle: mount the panel and build the TOC for the
+            # current content
+            self._toc_tree = Tree("Table of Contents", id="toc-tree")
+            self._toc_panel = VerticalScroll(self._toc_tree, id="toc-panel")
+            self._main_container.mount(self._toc_panel, after=self._content_area)
+            self._build_table_of_contents()
+        if self._toc_panel is None:
+            return
         if show_toc:
-            toc_panel.add_class("visible")
+            self._toc_panel.add_class("visible")
         else:
-            toc_panel.remove_class("visible")
+            self._toc_panel.remove_class("visible")
 
     def watch_show_search(self, show_search: bool) -> None:
         """React to changes in the show_search state."""
@@ -153,8 +219,26 @@ class MarkdownViewerApp(App):
     # Event handlers
     def on_directory_tree_file_selected(self, event: DirectoryTree.FileSelected) -> None:
         """Handle file selection from the directory tree."""
-        if self.file_manager.is_markdown_file(event.path):
-            self._load_markdown_file(event.path)
+        if not self.file_manager.is_markdown_file(event.path):
+            return
+
+        # Coalesce bursts of selections (arrow-keying through the tree)
+        # so only the last file in the burst is actually loaded
+        if self._select_timer is not None:
+            self._select_timer.stop()
+        self._pending_selection = event.path
+        self._select_timer = self.set_timer(
+            FILE_SELECT_DEBOUNCE_DELAY,
+            self._load_pending_selection
+        )
+
+    def _load_pending_selection(self) -> None:
+        """Load the most recent debounced file-tree selection."""
+        self._select_timer = None
+        if self._pending_selection is not None:
+            path = self._pending_selection
+            self._pending_selection = None
+            self._load_markdown_file(path)
 
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
         """Handle TOC item selection to jump to the header."""
@@ -162,16 +246,26 @@ class MarkdownViewerApp(App):
             self._scroll_to_line(event.node.data)
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle search input changes."""
+        """Handle search input changes with a short debounce."""
         if event.input.id == "search-input":
-            self._perform_search(event.value)
+            # Coalesce rapid keystrokes so only the final value in a burst
+            # triggers the full search and re-highlight
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            self._pending_search = event.value
+            self._search_timer = self.set_timer(
+                SEARCH_DEBOUNCE_DELAY,
+                self._run_pending_search
+            )
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle Enter key in search input - go to next result."""
-        if event.input.id == "search-input" and self.search_engine.search_results:
-            self.search_engine.next_result()
-            self._update_search_highlights()
-            self._scroll_to_current_search_result()
+        if event.input.id == "search-input":
+            self._flush_pending_search()
+            if self.search_engine.search_results:
+                self.search_engine.next_result()
+                self._update_search_highlights()
+                self._scroll_to_current_search_result()
 
     def on_key(self, event: Key) -> None:
         """Handle key events."""
@@ -180,6 +274,7 @@ class MarkdownViewerApp(App):
                 self.show_search = False
                 event.prevent_default()
             elif event.key == "shift+enter" and self.search_engine.search_results:
+                self._flush_pending_search()
                 self.search_engine.previous_result()
                 self._update_search_highlights()
                 self._scroll_to_current_search_result()
@@ -211,12 +306,18 @@ class MarkdownViewerApp(App):
         if not self.markdown_content:
             self.sub_title = "No content to export"
             return
-        
+
+        # Rendering and writing run off the event loop
+        self._do_export()
+
+    @work(thread=True, exclusive=True, group="export")
+    def _do_export(self) -> None:
+        """Render and write the export files in a worker thread."""
         # Get HTML content if in rendered mode
         html_content = None
         if not self.show_raw:
-            html_content = self.markdown_processor.convert_to_html(self.markdown_content)
-        
+            html_content = self._html_rendered()
+
         # Export files
         base_name = self.file_manager.get_file_stem()
         export_paths = self.export_manager.export_markdown(
@@ -225,63 +326,169 @@ class MarkdownViewerApp(App):
             html_content,
             self.show_raw
         )
-        
+
         # Show export dialog
-        self._show_export_dialog(export_paths)
+        self.call_from_thread(self._show_export_dialog, export_paths)
 
     def action_open_browser(self) -> None:
         """Open the markdown in the default web browser."""
+        # Deferred import: only sessions that preview in a browser pay
+        # for it
+        import webbrowser
+
         # Check if we should open an exported file
         if self._export_html_path:
             webbrowser.open(f'file://{self._export_html_path.absolute()}')
             return
-        
-        # Generate HTML based on current view mode
-        if self.show_raw:
-            title = self.file_manager.get_filename() or APP_NAME
-            html_content = self.export_manager._generate_raw_html(
-                self.markdown_content, 
-                title
+
+        # HTML generation and the tempfile write run off the event loop
+        self._open_browser_async()
+
+    def _preview_html_payload(self) -> Tuple[bytes, bytes, bytes]:
+        """Get the encoded preview document as (head, body, tail) chunks, reusing the cached bytes when mode and content are unchanged."""
+        title = self.file_manager.get_filename() or APP_NAME
+        doc_key = (self.show_raw, hash(self.markdown_content), title)
+        if self._html_doc_cache is None or self._html_doc_cache[0] != doc_key:
+            # The document stays in three pieces so the full page never
+            # has to exist as a single string in memory
+            if self.show_raw:
+                head = RAW_HTML_HEAD.substitute(title=title)
+                body = self.markdown_content.translate(HTML_ESCAPE_TABLE)
+                tail = RAW_HTML_TAIL
+            else:
+                head = RENDERED_HTML_HEAD.substitute(title=title)
+                body = self._html_rendered()
+                tail = RENDERED_HTML_TAIL
+            self._html_doc_cache = (
+                doc_key,
+                (head.encode('utf-8'), body.encode('utf-8'), tail.encode('utf-8'))
             )
+        return self._html_doc_cache[1]
+
+    @work(thread=True, exclusive=True, group="browser-preview")
+    def _open_browser_async(self) -> None:
+        """Generate the preview HTML and open it in a worker thread."""
+        import tempfile
+        import webbrowser
+
+        # Write the already-encoded chunks directly rather than going
+        # through the text-mode encoder
+        head, body, tail = self._preview_html_payload()
+
+        # Repeat presses with unchanged mode/content just reopen the
+        # file that was already written
+        written_sig = self._html_doc_cache[0]
+        if written_sig == self._last_written_sig and self._tmp_html_path is not None:
+            webbrowser.open(f'file://{self._tmp_html_path}')
+            return
+
+        # One temp file per session, rewritten in place; creating a new
+        # delete=False file per keypress leaks disk for the whole session
+        if self._tmp_html_path is None:
+            fd, self._tmp_html_path = tempfile.mkstemp(suffix='.html')
+            atexit.register(self._cleanup_tmp_html)
         else:
-            title = self.file_manager.get_filename() or APP_NAME
-            html_rendered = self.markdown_processor.convert_to_html(self.markdown_content)
-            html_content = self.export_manager._generate_rendered_html(
-                html_rendered,
-                title
-            )
-        
-        # Create temporary file and open in browser
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as tmp_file:
-            tmp_file.write(html_content)
-            tmp_file_path = tmp_file.name
-        
-        webbrowser.open(f'file://{tmp_file_path}')
+            fd = os.open(self._tmp_html_path, os.O_WRONLY | os.O_TRUNC)
+        try:
+            os.write(fd, head)
+            os.write(fd, body)
+            os.write(fd, tail)
+        finally:
+            os.close(fd)
+        self._last_written_sig = written_sig
+
+        webbrowser.open(f'file://{self._tmp_html_path}')
+
+    def _cleanup_tmp_html(self) -> None:
+        """Remove the session's preview temp file on shutdown."""
+        if self._tmp_html_path is not None:
+            try:
+                os.unlink(self._tmp_html_path)
+            except OSError:
+                pass
 
     # Private methods
-    def _load_initial_file(self, markdown_path: Path) -> None:
-        """Load the initial markdown file."""
-        content, last_modified = self.file_manager.load_file(markdown_path)
+    def _set_content(self, content: str) -> None:
+        """
+        Set the document content (sole mutator for markdown_content).
+
+        Warms the mermaid-processed cache immediately so the cost is paid
+        here, once, instead of inside the next render pass.
+        """
         self.markdown_content = content
+        self._processed_markdown()
+
+    def _processed_markdown(self) -> str:
+        """Get the mermaid-processed markdown, reusing the cached result when content is unchanged."""
+        content_hash = hash(self.markdown_content)
+        if self._md_cache is None or self._md_cache[0] != content_hash:
+            processed = self.markdown_processor.process_with_mermaid(self.markdown_content)
+            self._md_cache = (content_hash, processed)
+        return self._md_cache[1]
+
+    def _html_rendered(self) -> str:
+        """Get the HTML conversion of the content, reusing the cached result when content is unchanged."""
+        content_hash = hash(self.markdown_content)
+        if self._html_cache is None or self._html_cache[0] != content_hash:
+            html_content = self.markdown_processor.convert_to_html(self.markdown_content)
+            self._html_cache = (content_hash, html_content)
+        return self._html_cache[1]
+
+    def _raw_text(self) -> Text:
+        """Get the raw-view Text, reusing the cached object when content is unchanged."""
+        content_hash = hash(self.markdown_content)
+        if self._raw_text_cache is None or self._raw_text_cache[0] != content_hash:
+            # Text() treats the string as literal text (no markup parsing),
+            # so no escape pass is needed
+            self._raw_text_cache = (content_hash, Text(self.markdown_content))
+        return self._raw_text_cache[1]
+
+    def _line_starts(self) -> List[int]:
+        """Get the character offset of each line start, cached per content."""
+        content_hash = hash(self.markdown_content)
+        if self._line_starts_cache is None or self._line_starts_cache[0] != content_hash:
+            starts = [0]
+            find = self.markdown_content.find
+            pos = find('\n')
+            while pos != -1:
+                starts.append(pos + 1)
+                pos = find('\n', pos + 1)
+            self._line_starts_cache = (content_hash, starts)
+        return self._line_starts_cache[1]
 
     def _load_markdown_file(self, path: Path) -> None:
         """Load a markdown file and update the display."""
         # Stop watching the old file
         self.file_watcher.stop()
-        
-        # Load the new file
+
+        # Read off the event loop so large files don't freeze the UI
+        self._load_markdown_file_async(path)
+
+    @work(thread=True, exclusive=True, group="file-load")
+    def _load_markdown_file_async(self, path: Path) -> None:
+        """Read a file in a worker thread, then apply it on the UI thread."""
         content, last_modified = self.file_manager.load_file(path)
-        self.markdown_content = content
-        
-        # Update displays
-        self._update_both_views()
-        self._update_header_title()
-        self._build_table_of_contents()
-        
+        self.call_from_thread(self._apply_loaded_content, path, content, last_modified)
+
+    def _apply_loaded_content(
+        self,
+        path: Path,
+        content: str,
+        last_modified: Optional[float]
+    ) -> None:
+        """Apply freshly loaded file content to the UI."""
+        self._set_content(content)
+
+        # Update displays in a single render pass
+        with self.batch_update():
+            self._update_both_views()
+            self._update_header_title()
+            self._build_table_of_contents()
+
         # Start watching the new file
         if last_modified is not None:  # Only watch if file loaded successfully
             self.file_watcher.start(path)
-        
+
         # Clear search if active
         if self.show_search:
             self.search_engine.clear()
@@ -290,207 +497,349 @@ class MarkdownViewerApp(App):
     def _on_file_changed(self) -> None:
         """Callback for when the watched file changes."""
         # This is called from a background thread, so use call_from_thread
-        self.call_from_thread(self._reload_file)
+        self.call_from_thread(self._schedule_reload)
+
+    def _schedule_reload(self) -> None:
+        """Coalesce bursts of file-change events into a single reload."""
+        if self._reload_timer is not None:
+            self._reload_timer.stop()
+        self._reload_timer = self.set_timer(
+            FILE_RELOAD_DEBOUNCE_DELAY,
+            self._reload_file
+        )
 
     def _reload_file(self) -> None:
         """Reload the current file and update the display."""
         if not self.file_manager.current_file:
             return
-        
+        self._reload_file_async(self.file_manager.current_file)
+
+    @work(thread=True, exclusive=True, group="file-load")
+    def _reload_file_async(self, path: Path) -> None:
+        """Re-read the watched file in a worker thread."""
+        content, _ = self.file_manager.load_file(path)
+        self.call_from_thread(self._apply_reloaded_content, content)
+
+    def _apply_reloaded_content(self, content: str) -> None:
+        """Apply reloaded file content to the UI if it changed."""
         # Save current scroll position
-        scroll_container = self.query_one("#content-area", VerticalScroll)
+        scroll_container = self._content_area
         scroll_y = scroll_container.scroll_y
-        
-        # Reload the file
-        content, _ = self.file_manager.load_file(self.file_manager.current_file)
-        
+
         # Only update if content actually changed
         if content != self.markdown_content:
-            self.markdown_content = content
-            
-            # Update displays
-            self._update_both_views()
-            
-            # Re-run search if active
-            if self.search_engine.search_term:
-                self._perform_search(self.search_engine.search_term)
-            
-            # Rebuild table of contents
-            self._build_table_of_contents()
-            
-            # Restore scroll position
-            scroll_container.scroll_to(y=scroll_y, animate=False)
+            self._set_content(content)
+
+            with self.batch_update():
+                # Update displays
+                self._update_both_views()
+
+                # Re-run search if active
+                if self.search_engine.search_term:
+                    self._perform_search(self.search_engine.search_term)
+
+                # Rebuild table of contents
+                self._build_table_of_contents()
+
+                # Restore scroll position
+                scroll_container.scroll_to(y=scroll_y, animate=False)
             
             # Show notification
             self.sub_title = "File reloaded (auto)"
             self.set_timer(NOTIFICATION_DURATION, lambda: setattr(self, 'sub_title', ''))
 
+    def _render(self, content_changed: bool = False) -> None:
+        """
+        Sync view visibility and content in a single fused pass.
+
+        Args:
+            content_changed: Whether the widgets need fresh content pushed
+                (display flags are always synced)
+        """
+        markdown_view = self._markdown_view
+        raw_view = self._raw_view
+
+        with self.batch_update():
+            if content_changed:
+                self._markdown_dirty = True
+                self._raw_dirty = True
+
+            # Only the visible widget is refreshed; the hidden one keeps
+            # its dirty flag and catches up when it's next toggled in.
+            # Markdown.update is the expensive one (full re-parse), so
+            # this saves a parse per load while the raw view is showing.
+            if self.show_raw:
+                if self._raw_dirty:
+                    raw_view.update(self._raw_text())
+                    self._raw_dirty = False
+            elif self._markdown_dirty:
+                self._push_markdown(self._processed_markdown())
+                self._markdown_dirty = False
+
+            markdown_view.display = not self.show_raw
+            raw_view.display = self.show_raw
+
     def _update_view(self) -> None:
         """Update which view is displayed based on show_raw state."""
-        markdown_view = self.query_one("#markdown-view")
-        raw_view = self.query_one("#raw-view")
-        
-        if self.show_raw:
-            markdown_view.display = False
-            raw_view.display = True
-        else:
-            self._update_markdown_view()
-            markdown_view.display = True
-            raw_view.display = False
+        self._render()
 
     def _update_both_views(self) -> None:
         """Update both markdown and raw views with current content."""
-        markdown_view = self.query_one("#markdown-view", Markdown)
-        raw_view = self.query_one("#raw-view", Static)
-        
-        if not self.show_raw:
-            processed_content = self.markdown_processor.process_with_mermaid(self.markdown_content)
-            markdown_view.update(processed_content)
-        else:
-            markdown_view.update(self.markdown_content)
-        
-        raw_view.update(Text(escape(self.markdown_content)))
-
-    def _update_markdown_view(self) -> None:
-        """Update the markdown view with processed content."""
-        markdown_view = self.query_one("#markdown-view", Markdown)
-        processed_content = self.markdown_processor.process_with_mermaid(self.markdown_content)
-        markdown_view.update(processed_content)
+        self._render(content_changed=True)
 
     def _update_header_title(self) -> None:
         """Update the header title with filename and current mode."""
-        mode = "Raw" if self.show_raw else "Rendered"
-        watch_status = "👁" if self.file_watcher.enabled and self.file_watcher.is_active() else ""
-        
-        filename = self.file_manager.get_filename()
+        # Assigning title repaints the Header even when the string is
+        # identical, so bail out when none of the inputs changed
+        title_key = (
+            self.file_manager.get_filename(),
+            self.show_raw,
+            self.file_watcher.enabled and self.file_watcher.is_active()
+        )
+        if title_key == self._last_title_key:
+            return
+        self._last_title_key = title_key
+
+        filename, show_raw, watching = title_key
+        mode = "Raw" if show_raw else "Rendered"
+        watch_status = "👁" if watching else ""
+
         if filename:
-            self.title = f"{APP_NAME} - {filename} [{mode}] {watch_status}"
+            new_title = f"{APP_NAME} - {filename} [{mode}] {watch_status}"
         else:
-            self.title = f"{APP_NAME} - No file loaded [{mode}]"
+            new_title = f"{APP_NAME} - No file loaded [{mode}]"
+
+        if self.title != new_title:
+            self.title = new_title
+
+    def _header_fingerprint(self) -> bytes:
+        """Compute a cheap fingerprint of just the header lines in the content."""
+        header_lines = b"\n".join(
+            line for line in self.markdown_content.encode().split(b"\n")
+            if line.lstrip().startswith(b"#")
+        )
+        return hashlib.blake2b(header_lines, digest_size=8).digest()
 
     def _build_table_of_contents(self) -> None:
         """Build the table of contents tree from markdown headers."""
+        # Nothing to do until the TOC panel has been mounted; the first
+        # toggle builds it for the current content
+        if self._toc_tree is None:
+            return
+
+        # Skip the rebuild entirely when no header line changed (typical
+        # auto-reload edits only touch body text)
+        fingerprint = self._header_fingerprint()
+        if fingerprint == self._toc_fingerprint:
+            return
+        self._toc_fingerprint = fingerprint
+
         headers = self.markdown_processor.parse_headers(self.markdown_content)
-        toc_tree = self.query_one("#toc-tree", Tree)
+        toc_tree = self._toc_tree
         self.ui_helper.build_toc_tree(toc_tree, headers)
 
     def _focus_content_area(self) -> None:
         """Focus the appropriate content view."""
         if self.show_raw:
-            self.query_one("#raw-view", Static).focus()
+            self._raw_view.focus()
         else:
-            self.query_one("#markdown-view", Markdown).focus()
+            self._markdown_view.focus()
 
     def _show_search_input(self) -> None:
         """Show the search input widget."""
-        search_input = Input(
-            placeholder=SEARCH_PLACEHOLDER,
-            id="search-input"
-        )
-        header = self.query_one(Header)
-        self.mount(search_input, after=header)
+        search_input = self._search_input
+        search_input.placeholder = SEARCH_PLACEHOLDER
+        search_input.can_focus = True
         search_input.add_class("visible")
         search_input.focus()
 
     def _hide_search_input(self) -> None:
-        """Hide and remove the search input widget."""
-        try:
-            search_input = self.query_one("#search-input", Input)
-            search_input.remove()
-            
-            # Clear search state
-            self.search_engine.clear()
-            self._update_search_highlights()
-            
-            # Reset views to original content
-            self._update_both_views()
-            
-            # Focus back on content
-            self._focus_content_area()
-        except:
-            pass  # Search input doesn't exist
+        """Hide the search input widget without unmounting it."""
+        search_input = self._search_input
+        search_input.remove_class("visible")
+        search_input.can_focus = False
+        search_input.value = ""
+
+        # Clear search state
+        self.search_engine.clear()
+        self._update_search_highlights()
+
+        # Reset views to original content
+        self._update_both_views()
+
+        # Focus back on content
+        self._focus_content_area()
+
+    def _run_pending_search(self) -> None:
+        """Run the search queued by the debounce timer."""
+        self._search_timer = None
+        if self._pending_search is not None:
+            search_term = self._pending_search
+            self._pending_search = None
+            self._perform_search(search_term)
+
+    def _flush_pending_search(self) -> None:
+        """Run any debounced search immediately (e.g. before navigating results)."""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._run_pending_search()
 
     def _perform_search(self, search_term: str) -> None:
         """Perform search in the current content."""
         self.search_engine.search(self.markdown_content, search_term)
-        self._update_search_highlights()
-        
-        if self.search_engine.search_results:
-            self._scroll_to_current_search_result()
-        
-        # Update search input placeholder with results count
-        self._update_search_placeholder()
+
+        # Coalesce the highlight push, scroll and placeholder change
+        # into one paint
+        with self.batch_update():
+            self._update_search_highlights()
+
+            if self.search_engine.search_results:
+                self._scroll_to_current_search_result()
+
+            # Update search input placeholder with results count
+            self._update_search_placeholder()
 
     def _update_search_highlights(self) -> None:
         """Update the display to highlight search results."""
-        # Update subtitle with search status
-        if self.search_engine.search_results:
-            self.sub_title = self.ui_helper.generate_search_status(
-                self.search_engine.search_term,
-                self.search_engine.get_result_count(),
-                self.search_engine.current_index + 1
+        with self.batch_update():
+            # Update subtitle with search status
+            if self.search_engine.search_results:
+                self.sub_title = self.ui_helper.generate_search_status(
+                    self.search_engine.search_term,
+                    self.search_engine.get_result_count(),
+                    self.search_engine.current_index + 1
+                )
+            elif self.search_engine.search_term:
+                self.sub_title = f"Search: {self.search_engine.search_term} (no matches)"
+            else:
+                self.sub_title = ""
+
+            # Skip the expensive view rebuild when nothing affecting the
+            # rendered highlights changed (e.g. a bare modifier keypress)
+            highlight_key = (
+                hash(self.markdown_content),
+                hash(tuple(self.search_engine.search_results)),
+                self.search_engine.current_index,
+                self.show_raw
             )
-        elif self.search_engine.search_term:
-            self.sub_title = f"Search: {self.search_engine.search_term} (no matches)"
-        else:
-            self.sub_title = ""
-        
-        # Update content display with highlights
-        if self.search_engine.search_term or self.search_engine.search_results:
-            if self.show_raw:
-                self._update_raw_view_with_highlights()
+            if highlight_key == self._last_highlight_key:
+                return
+            self._last_highlight_key = highlight_key
+
+            # Update content display with highlights
+            if self.search_engine.search_term or self.search_engine.search_results:
+                if self.show_raw:
+                    self._update_raw_view_with_highlights()
+                else:
+                    self._update_markdown_view_with_highlights()
             else:
-                self._update_markdown_view_with_highlights()
-        else:
-            # Reset to plain content if no search
-            self._update_both_views()
+                # Reset to plain content if no search
+                self._update_both_views()
 
     def _update_raw_view_with_highlights(self) -> None:
         """Update the raw view with search highlights."""
-        raw_view = self.query_one("#raw-view", Static)
-        
-        if not self.search_engine.search_results:
-            raw_view.update(Text(escape(self.markdown_content)))
+        raw_view = self._raw_view
+        results = self.search_engine.search_results
+
+        if not results:
+            raw_view.update(self._raw_text())
             return
-        
-        highlighted_text = self.ui_helper.create_highlighted_text(
-            self.markdown_content,
-            self.search_engine.search_results,
-            self.search_engine.current_index
-        )
+
+        # Style the non-current matches once per (content, results);
+        # moving between results then only copies the cached Text and
+        # restyles the current span, instead of re-applying every match
+        # per navigation. The cap already bounds this to 50 spans, so
+        # all matches are styled and scrolling never reveals unstyled
+        # ones.
+        styled_key = (hash(self.markdown_content), hash(tuple(results)))
+        if self._styled_raw_cache is None or self._styled_raw_cache[0] != styled_key:
+            base = self.ui_helper.create_highlighted_text(
+                self.markdown_content,
+                results,
+                -1,  # current match is styled on the copy below
+                base=self._raw_text()
+            )
+            self._styled_raw_cache = (styled_key, base)
+
+        highlighted_text = self._styled_raw_cache[1].copy()
+        start, end = results[self.search_engine.current_index]
+        highlighted_text.stylize(CURRENT_MATCH_STYLE, start, end)
         raw_view.update(highlighted_text)
 
+    def _markdown_highlight_segments(self, results: List[Tuple[int, int]]) -> List[str]:
+        """
+        Split the content at match boundaries, reusing the cached split
+        while the content and result set are unchanged.
+
+        The list alternates gap/match/gap/... so navigating between results
+        only re-joins the pieces instead of re-splicing the whole document.
+        """
+        segments_key = (hash(self.markdown_content), hash(tuple(results)))
+        if self._md_segments_cache is None or self._md_segments_cache[0] != segments_key:
+            content = self.markdown_content
+            segments = []
+            prev_end = 0
+            for start, end in results:
+                segments.append(content[prev_end:start])
+                segments.append(content[start:end])
+                prev_end = end
+            segments.append(content[prev_end:])
+            self._md_segments_cache = (segments_key, segments)
+        return self._md_segments_cache[1]
+
+    def _push_markdown(self, content: str) -> None:
+        """
+        Update the markdown view, skipping pushes of identical content.
+
+        Every Markdown.update is a full re-parse, so duplicate pushes
+        (e.g. clearing an already-cleared search) are worth dropping.
+        """
+        push_key = hash(content)
+        if push_key == self._last_md_push:
+            return
+        self._last_md_push = push_key
+        self._markdown_view.update(content)
+
     def _update_markdown_view_with_highlights(self) -> None:
         """Update the markdown view with search highlights."""
-        markdown_view = self.query_one("#markdown-view", Markdown)
-        
         if not self.search_engine.search_results:
-            markdown_view.update(self.markdown_content)
+            self._push_markdown(self.markdown_content)
             return
-        
-        highlighted_content = self.ui_helper.create_highlighted_markdown(
-            self.markdown_content,
+
+        # Same defense the UIHelper paths have: overlapping spans would
+        # duplicate document text when the segments are rejoined
+        results, current_index = coalesce_matches(
             self.search_engine.search_results,
             self.search_engine.current_index
         )
-        
-        markdown_view.update(highlighted_content)
+        segments = self._markdown_highlight_segments(results)
+
+        parts = []
+        for i in range(len(segments) // 2):
+            parts.append(segments[2 * i])
+            match_text = segments[2 * i + 1]
+            if i == current_index:
+                # Current match - use distinctive markers
+                parts.append(f'【{match_text}】')
+            else:
+                # Other matches - use lighter markers
+                parts.append(f'〖{match_text}〗')
+        parts.append(segments[-1])
+
+        self._push_markdown(''.join(parts))
 
     def _update_search_placeholder(self) -> None:
         """Update the search input placeholder with results information."""
-        try:
-            search_input = self.query_one("#search-input", Input)
-            if self.search_engine.search_results:
-                position_info = self.search_engine.get_current_position_info()
-                search_input.placeholder = f"Search ({position_info} matches) - Enter: next, Shift+Enter: previous, Esc: close"
-            else:
-                search_input.placeholder = SEARCH_NO_MATCHES_PLACEHOLDER
-        except:
-            pass  # Search input doesn't exist
+        search_input = self._search_input
+        if self.search_engine.search_results:
+            position_info = self.search_engine.get_current_position_info()
+            search_input.placeholder = f"Search ({position_info} matches) - Enter: next, Shift+Enter: previous, Esc: close"
+        else:
+            search_input.placeholder = SEARCH_NO_MATCHES_PLACEHOLDER
 
     def _scroll_to_line(self, line_number: int) -> None:
         """Scroll to a specific line number."""
-        scroll_container = self.query_one("#content-area", VerticalScroll)
+        scroll_container = self._content_area
         
         try:
             viewport_height = scroll_container.size.height
@@ -506,9 +855,11 @@ class MarkdownViewerApp(App):
             return
         
         start, _ = current_result
-        line_number = self.search_engine.calculate_line_number(self.markdown_content, start)
+        # O(log N) lookup in the cached line index instead of counting
+        # newlines from the top of the document
+        line_number = bisect.bisect_right(self._line_starts(), start) - 1
         
-        scroll_container = self.query_one("#content-area", VerticalScroll)
+        scroll_container = self._content_area
         
         try:
             viewport_height = scroll_container.size.height
@@ -525,15 +876,19 @@ class MarkdownViewerApp(App):
         
         # Display dialog content
         dialog_content = self.export_manager.generate_export_dialog_content(export_paths)
-        self.markdown_content = dialog_content
+        self._set_content(dialog_content)
         self.file_manager.current_file = None
-        
-        # Update views
-        self._update_both_views()
-        
-        # Update header
-        self.title = "Export Complete"
-        
+
+        with self.batch_update():
+            # Update views
+            self._update_both_views()
+
+            # Update header; the direct assignment bypasses
+            # _update_header_title, so drop its memo key or the
+            # restore call would early-return and leave this title up
+            self.title = "Export Complete"
+            self._last_title_key = None
+
         # Store HTML path for opening
         self._export_html_path = export_paths.html
         
@@ -543,14 +898,15 @@ class MarkdownViewerApp(App):
     def _restore_after_export(self) -> None:
         """Restore original content after showing export dialog."""
         if self._original_content is not None:
-            self.markdown_content = self._original_content
+            self._set_content(self._original_content)
             self.file_manager.current_file = self._original_path
-            
-            # Update views
-            self._update_both_views()
-            
-            # Update header
-            self._update_header_title()
+
+            with self.batch_update():
+                # Update views
+                self._update_both_views()
+
+                # Update header
+                self._update_header_title()
             
             # Clear temporary state
             self._export_html_path = None
@@ -13,6 +13,10 @@ class MermaidBlock:
     start_line: int
     end_line: int
     content: str
+    # Character offsets of the block (opening fence start to closing
+    # fence end) so callers can splice the source by slicing
+    start_offset: int = 0
+    end_offset: int = 0
 
 
 @dataclass
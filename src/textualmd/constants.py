@@ -3,13 +3,14 @@ Constants and configuration values for the Markdown Viewer application.
 """
 
 from pathlib import Path
+from string import Template
 
 # Application metadata
 APP_NAME = "Markdown Viewer"
 APP_VERSION = "1.0.0"
 
 # File types
-MARKDOWN_EXTENSIONS = ['.md', '.markdown']
+MARKDOWN_EXTENSIONS = frozenset({'.md', '.markdown'})
 
 # UI dimensions
 FILE_TREE_WIDTH = 30
@@ -18,9 +19,12 @@ TOC_PANEL_WIDTH = 30
 # File watching
 FILE_WATCH_INTERVAL = 1.0  # seconds
 FILE_WATCH_JOIN_TIMEOUT = 1.0  # seconds
+FILE_RELOAD_DEBOUNCE_DELAY = 0.15  # seconds
+FILE_SELECT_DEBOUNCE_DELAY = 0.075  # seconds
 
 # Search
 SEARCH_RESULTS_CAP = 50
+SEARCH_DEBOUNCE_DELAY = 0.1  # seconds
 SEARCH_PLACEHOLDER = "Search in document... (Enter: next, Shift+Enter: previous, Esc: close)"
 SEARCH_NO_MATCHES_PLACEHOLDER = "No matches found - Esc: close"
 
@@ -36,6 +40,31 @@ EXPORT_DIALOG_DURATION = 10.0  # seconds
 MERMAID_PREVIEW_LINES = 3
 MERMAID_PREVIEW_MAX_LENGTH = 36
 
+# Static pieces of the terminal placeholder box drawn for Mermaid blocks
+MERMAID_BOX_HEADER = (
+    '```',
+    '╔══════════════════════════════════════╗',
+    '║        MERMAID DIAGRAM               ║',
+    '║                                      ║',
+    '║  [View in browser with "o" key]      ║',
+    '║                                      ║',
+)
+MERMAID_BOX_ELLIPSIS = '║  ...                                 ║'
+MERMAID_BOX_FOOTER = (
+    '╚══════════════════════════════════════╝',
+    '```',
+)
+
+# Single-pass HTML escaping table; html.escape makes five .replace
+# passes over the content, str.translate does one
+HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
 # HTML templates
 HTML_STYLE = """
     body {
@@ -110,6 +139,49 @@ RAW_HTML_STYLE = """
     }
 """
 
+# Full HTML documents for export/browser preview. The style blocks are
+# interpolated once at import time; only $title and $body vary per call
+# (string.Template because the CSS is full of literal braces).
+RENDERED_HTML_TEMPLATE = Template(f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>${{title}}</title>
+    <script src="https://cdn.jsdelivr.net/npm/mermaid/dist/mermaid.min.js"></script>
+    <script>
+        mermaid.initialize({{ startOnLoad: true, theme: 'default' }});
+    </script>
+    <style>
+{HTML_STYLE}
+    </style>
+</head>
+<body>
+    ${{body}}
+</body>
+</html>""")
+
+RAW_HTML_TEMPLATE = Template(f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>${{title}} (Raw)</title>
+    <style>
+{RAW_HTML_STYLE}
+    </style>
+</head>
+<body>
+    <pre>${{body}}</pre>
+</body>
+</html>""")
+
+# Head/tail halves of the templates, so a document can be written in
+# three chunks without first concatenating head + body + tail into a
+# second full-size string
+_RENDERED_HEAD_SRC, RENDERED_HTML_TAIL = RENDERED_HTML_TEMPLATE.template.split('${body}')
+RENDERED_HTML_HEAD = Template(_RENDERED_HEAD_SRC)
+_RAW_HEAD_SRC, RAW_HTML_TAIL = RAW_HTML_TEMPLATE.template.split('${body}')
+RAW_HTML_HEAD = Template(_RAW_HEAD_SRC)
+
 # Default content
 DEFAULT_CONTENT = """# Welcome to Markdown Viewer
 
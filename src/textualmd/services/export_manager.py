@@ -3,14 +3,16 @@ Service for handling export functionality.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from ..app_types import ExportPaths
 from ..constants import (
-    EXPORT_DIR_NAME, 
-    EXPORT_TIMESTAMP_FORMAT, 
-    HTML_STYLE, 
-    RAW_HTML_STYLE
+    EXPORT_DIR_NAME,
+    EXPORT_TIMESTAMP_FORMAT,
+    HTML_ESCAPE_TABLE,
+    RENDERED_HTML_TEMPLATE,
+    RAW_HTML_TEMPLATE
 )
 
 
@@ -67,11 +69,13 @@ class ExportManager:
             html_document = self._generate_raw_html(content, title)
         else:
             if not html_content:
-                from markdown import markdown
-                html_content = markdown(content)
+                from .markdown_processor import render_html
+                html_content = render_html(content)
             html_document = self._generate_rendered_html(html_content, title)
-        
-        output_path.write_text(html_document, encoding='utf-8')
+
+        # write_bytes with a single explicit encode avoids the text-layer
+        # buffering write_text adds on top of the same encode
+        output_path.write_bytes(html_document.encode('utf-8'))
     
     def export_as_text(self, content: str, output_path: Path) -> None:
         """
@@ -81,7 +85,7 @@ class ExportManager:
             content: The text content to export
             output_path: Path to save the text file
         """
-        output_path.write_text(content, encoding='utf-8')
+        output_path.write_bytes(content.encode('utf-8'))
     
     def export_markdown(
         self, 
@@ -108,51 +112,29 @@ class ExportManager:
         html_path = self.generate_export_filename(base_name, 'html')
         text_path = self.generate_export_filename(base_name, 'txt')
         
-        # Export files
-        self.export_as_html(content, base_name, html_path, html_content, is_raw)
-        self.export_as_text(content, text_path)
-        
+        # The two writes are independent and release the GIL, so overlap
+        # them; wall time approaches the slower write instead of the sum
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            html_future = executor.submit(
+                self.export_as_html,
+                content, base_name, html_path, html_content, is_raw
+            )
+            text_future = executor.submit(self.export_as_text, content, text_path)
+            html_future.result()
+            text_future.result()
+
         return ExportPaths(html=html_path, text=text_path)
     
     def _generate_raw_html(self, content: str, title: str) -> str:
         """Generate HTML for raw markdown view."""
-        # Escape HTML entities
-        from html import escape
-        escaped_content = escape(content)
-        
-        return f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <title>{title} (Raw)</title>
-    <style>
-{RAW_HTML_STYLE}
-    </style>
-</head>
-<body>
-    <pre>{escaped_content}</pre>
-</body>
-</html>"""
-    
+        # Escape HTML entities in one translate pass
+        escaped_content = content.translate(HTML_ESCAPE_TABLE)
+
+        return RAW_HTML_TEMPLATE.substitute(title=title, body=escaped_content)
+
     def _generate_rendered_html(self, html_content: str, title: str) -> str:
         """Generate HTML for rendered markdown view."""
-        return f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <title>{title}</title>
-    <script src="https://cdn.jsdelivr.net/npm/mermaid/dist/mermaid.min.js"></script>
-    <script>
-        mermaid.initialize({{ startOnLoad: true, theme: 'default' }});
-    </script>
-    <style>
-{HTML_STYLE}
-    </style>
-</head>
-<body>
-    {html_content}
-</body>
-</html>"""
+        return RENDERED_HTML_TEMPLATE.substitute(title=title, body=html_content)
     
     def generate_export_dialog_content(self, export_paths: ExportPaths) -> str:
         """
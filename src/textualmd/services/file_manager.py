@@ -2,6 +2,8 @@
 Service for handling file operations.
 """
 
+import hashlib
+import os
 from pathlib import Path
 from typing import Optional, Tuple
 from ..constants import MARKDOWN_EXTENSIONS, ERROR_CONTENT_TEMPLATE
@@ -9,10 +11,12 @@ from ..constants import MARKDOWN_EXTENSIONS, ERROR_CONTENT_TEMPLATE
 
 class FileManager:
     """Handles file-related operations."""
-    
+
     def __init__(self):
         self.current_file: Optional[Path] = None
         self.current_content: str = ""
+        self._content_digest: Optional[bytes] = None
+        self._last_mtime: Optional[float] = None
     
     def load_file(self, file_path: Path) -> Tuple[str, Optional[float]]:
         """
@@ -31,12 +35,42 @@ class FileManager:
                 )
                 return error_msg, None
             
-            content = file_path.read_text(encoding='utf-8')
-            last_modified = file_path.stat().st_mtime
-            
+            # A spurious watcher tick on the same file with an unchanged
+            # mtime costs one stat instead of a full read and digest
+            if file_path == self.current_file:
+                last_modified = file_path.stat().st_mtime
+                if last_modified == self._last_mtime:
+                    return self.current_content, last_modified
+
+            # One open serves both the read and the mtime: fstat on the
+            # held fd replaces the separate stat call, and reading the
+            # raw bytes skips read_text's universal-newline pass
+            fd = os.open(str(file_path), os.O_RDONLY)
+            try:
+                stat_result = os.fstat(fd)
+                data = os.read(fd, stat_result.st_size)
+            finally:
+                os.close(fd)
+            last_modified = stat_result.st_mtime
+
+            # A reload of byte-identical content (editor touched the
+            # mtime without changing the file) returns the existing
+            # string, so the caller's equality check short-circuits on
+            # identity and the decode is skipped
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if file_path == self.current_file and digest == self._content_digest:
+                self._last_mtime = last_modified
+                return self.current_content, last_modified
+
+            content = data.decode('utf-8')
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+
             self.current_file = file_path
             self.current_content = content
-            
+            self._content_digest = digest
+            self._last_mtime = last_modified
+
             return content, last_modified
             
         except Exception as e:
@@ -55,7 +89,10 @@ class FileManager:
         Returns:
             True if the file has a markdown extension
         """
-        return file_path.suffix.lower() in MARKDOWN_EXTENSIONS
+        # Suffixes are almost always lowercase already; checking the
+        # original first skips the .lower() allocation per entry
+        suffix = file_path.suffix
+        return suffix in MARKDOWN_EXTENSIONS or suffix.lower() in MARKDOWN_EXTENSIONS
     
     def get_filename(self) -> str:
         """
@@ -2,86 +2,140 @@
 Service for watching files for changes.
 """
 
+import os
 import threading
-import time
 from pathlib import Path
 from typing import Optional, Callable
 from ..constants import FILE_WATCH_INTERVAL, FILE_WATCH_JOIN_TIMEOUT
 
+# Event-driven watching when the optional watchfiles package is present
+# (inotify/FSEvents; install with: pip install textualmd[watch]); the
+# mtime polling loop below remains as the fallback.
+try:
+    from watchfiles import watch as _watchfiles_watch
+except ImportError:
+    _watchfiles_watch = None
+
 
 class FileWatcher:
     """Handles file watching operations."""
-    
+
     def __init__(self, callback: Callable[[], None]):
         """
         Initialize the file watcher.
-        
+
         Args:
             callback: Function to call when file changes are detected
         """
         self.callback = callback
         self.file_path: Optional[Path] = None
-        self.last_modified: Optional[float] = None
+        # Nanosecond mtimes compare as exact integers; float st_mtime can
+        # truncate and miss updates
+        self.last_modified_ns: Optional[int] = None
+        self._path_str: Optional[str] = None
         self.watching = False
         self.watcher_thread: Optional[threading.Thread] = None
         self.enabled = True
-    
+        self._stop_event = threading.Event()
+
     def start(self, file_path: Path) -> None:
         """
         Start watching a file for changes.
-        
+
         Args:
             file_path: Path to the file to watch
         """
         if not file_path.exists():
             return
-        
+
         # Stop any existing watcher
         self.stop()
-        
+
         self.file_path = file_path
-        self.last_modified = file_path.stat().st_mtime
+        self._path_str = str(file_path)
+        self.last_modified_ns = os.stat(self._path_str).st_mtime_ns
         self.watching = True
-        
+        self._stop_event = threading.Event()
+
         self.watcher_thread = threading.Thread(
             target=self._watch_loop,
             daemon=True
         )
         self.watcher_thread.start()
-    
+
     def stop(self) -> None:
         """Stop watching the current file."""
         self.watching = False
-        
+        self._stop_event.set()
+
         if self.watcher_thread and self.watcher_thread.is_alive():
             self.watcher_thread.join(timeout=FILE_WATCH_JOIN_TIMEOUT)
-        
+
         self.watcher_thread = None
         self.file_path = None
-        self.last_modified = None
-    
+        self._path_str = None
+        self.last_modified_ns = None
+
     def _watch_loop(self) -> None:
         """Background thread loop to watch for file changes."""
-        while self.watching and self.enabled and self.file_path:
+        if _watchfiles_watch is not None:
+            self._watch_events()
+        else:
+            self._watch_poll()
+
+    def _watch_events(self) -> None:
+        """Block on kernel file-change events until stopped."""
+        target = str(self.file_path.resolve())
+        try:
+            for changes in _watchfiles_watch(
+                str(self.file_path.parent),
+                stop_event=self._stop_event
+            ):
+                if not self.watching or not self.enabled:
+                    break
+                if any(changed_path == target for _, changed_path in changes):
+                    try:
+                        self.last_modified_ns = os.stat(self._path_str).st_mtime_ns
+                    except OSError:
+                        pass
+                    self.callback()
+        except Exception as e:
+            # Log error and stop watching
+            print(f"File watching error: {e}")
+
+    def _watch_poll(self) -> None:
+        """Fallback mtime polling loop."""
+        path_str = self._path_str
+        while self.watching and self.enabled and path_str:
             try:
-                if self.file_path.exists():
-                    current_mtime = self.file_path.stat().st_mtime
-                    if self.last_modified and current_mtime > self.last_modified:
-                        self.last_modified = current_mtime
-                        self.callback()
-                
-                time.sleep(FILE_WATCH_INTERVAL)
-                
+                try:
+                    current_mtime_ns = os.stat(path_str).st_mtime_ns
+                except FileNotFoundError:
+                    current_mtime_ns = None
+
+                if (
+                    current_mtime_ns is not None
+                    and self.last_modified_ns is not None
+                    and current_mtime_ns > self.last_modified_ns
+                ):
+                    self.last_modified_ns = current_mtime_ns
+                    self.callback()
+
+                # An Event wait is interruptible, so stop() wakes the
+                # loop immediately instead of after a full interval
+                if self._stop_event.wait(FILE_WATCH_INTERVAL):
+                    break
+
             except Exception as e:
                 # Log error and stop watching
                 print(f"File watching error: {e}")
                 break
-    
+
     def is_active(self) -> bool:
         """Check if file watching is currently active."""
         return self.watching and self.watcher_thread is not None
-    
+
     def toggle_enabled(self) -> bool:
         """Toggle file watching on/off. Returns new enabled state."""
         self.enabled = not self.enabled
-        return self.enabled 
\ No newline at end of file
+        return self.enabled
@@ -3,166 +3,249 @@ Service for processing markdown content.
 """
 
 import re
-from typing import List, Optional
-from markdown import markdown
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from ..app_types import MermaidBlock, Header, MermaidBlockList, HeaderList
-from ..constants import MERMAID_PREVIEW_LINES, MERMAID_PREVIEW_MAX_LENGTH
+from ..constants import (
+    MERMAID_PREVIEW_LINES,
+    MERMAID_PREVIEW_MAX_LENGTH,
+    MERMAID_BOX_HEADER,
+    MERMAID_BOX_ELLIPSIS,
+    MERMAID_BOX_FOOTER
+)
+
+# The HTML backend is resolved on first conversion rather than at import:
+# both candidates are import-heavy (Python-Markdown compiles many regexes,
+# cmarkgfm loads a CFFI extension) and most sessions never render HTML.
+_render_backend = None
+
+
+def _resolve_render_backend():
+    """Pick the fastest available markdown-to-HTML converter.
+
+    Prefers the C-backed cmark-gfm parser, which converts large documents
+    an order of magnitude faster than the pure-Python markdown package.
+    Install it with: pip install textualmd[fast]
+    """
+    try:
+        import cmarkgfm
+        from cmarkgfm.cmark import Options
+    except ImportError:
+        from markdown import markdown
+        return markdown
+
+    def _cmark_render(content: str) -> str:
+        # UNSAFE keeps raw HTML (the Mermaid <div> wrappers) in the output
+        return cmarkgfm.github_flavored_markdown_to_html(
+            content,
+            options=Options.CMARK_OPT_UNSAFE
+        )
+
+    return _cmark_render
+
+
+def render_html(content: str) -> str:
+    """Convert markdown to an HTML fragment."""
+    global _render_backend
+    if _render_backend is None:
+        _render_backend = _resolve_render_backend()
+    return _render_backend(content)
+
+# ATX-style header line, e.g. "## Title" (optionally indented; the
+# title must start with a non-space so bare "#" lines never match)
+_HEADER_RE = re.compile(r'^[^\S\n]*(#{1,6})[^\S\n]+(\S[^\n]*)', re.MULTILINE)
+
+# Any fenced-code delimiter line (optionally indented). Detection pairs
+# these up rather than walking every line of the document.
+_FENCE_RE = re.compile(r'^[^\S\n]*```[^\n]*', re.MULTILINE)
+
+# Cache size for the module-level render caches. Bounded so repeated
+# renders of identical content (view toggles, export followed by
+# browser-open, transient dialog content) are O(1) lookups without
+# unbounded memory growth.
+PROCESSOR_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=PROCESSOR_CACHE_SIZE)
+def _detect_mermaid_blocks(content: str) -> Tuple[MermaidBlock, ...]:
+    """Scan content for Mermaid fenced blocks (cached per content)."""
+    # Most documents contain no Mermaid at all; a substring probe is far
+    # cheaper than splitting and walking every line to find that out
+    if '```mermaid' not in content:
+        return ()
+
+    # Single regex pass finds the fence lines; the C-level scan skips
+    # straight between delimiters instead of inspecting every line.
+    # Line numbers are derived from a running newline count up to each
+    # fence, and an unterminated block still yields nothing.
+    mermaid_blocks = []
+    open_fence = None
+    open_line = -1
+    line = 0
+    pos = 0
+
+    for fence in _FENCE_RE.finditer(content):
+        line += content.count('\n', pos, fence.start())
+        pos = fence.start()
+        stripped = fence.group().strip()
+        if stripped.startswith('```mermaid'):
+            open_fence = fence
+            open_line = line
+        elif open_fence is not None and stripped == '```':
+            mermaid_blocks.append(MermaidBlock(
+                start_line=open_line,
+                end_line=line,
+                content=content[open_fence.end() + 1:fence.start() - 1],
+                start_offset=open_fence.start(),
+                end_offset=fence.end()
+            ))
+            open_fence = None
+
+    return tuple(mermaid_blocks)
+
+
+@lru_cache(maxsize=PROCESSOR_CACHE_SIZE)
+def _process_with_mermaid(content: str) -> str:
+    """Replace Mermaid blocks with terminal placeholders (cached per content)."""
+    mermaid_blocks = _detect_mermaid_blocks(content)
+
+    if not mermaid_blocks:
+        return content
+
+    # Splice by slicing the original string at the block offsets; a
+    # split/join round-trip would copy every line of the document
+    parts = []
+    cursor = 0
+
+    for block in mermaid_blocks:
+        # Add content before the Mermaid block
+        parts.append(content[cursor:block.start_offset])
+
+        # Add a placeholder for the Mermaid diagram
+        placeholder = list(MERMAID_BOX_HEADER)
+
+        # Add a preview of the Mermaid content; ljust skips the
+        # format-spec parsing an f-string pad would redo per line
+        block_lines = block.content.strip().split('\n')
+        preview_lines = block_lines[:MERMAID_PREVIEW_LINES]
+        for line in preview_lines:
+            if len(line) > MERMAID_PREVIEW_MAX_LENGTH:
+                line = line[:MERMAID_PREVIEW_MAX_LENGTH - 3] + '...'
+            placeholder.append('║  ' + line.ljust(MERMAID_PREVIEW_MAX_LENGTH) + ' ║')
+
+        if len(preview_lines) < len(block_lines):
+            placeholder.append(MERMAID_BOX_ELLIPSIS)
+
+        placeholder.extend(MERMAID_BOX_FOOTER)
+
+        parts.append('\n'.join(placeholder))
+        cursor = block.end_offset
+
+    # Add remaining content
+    parts.append(content[cursor:])
+
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=PROCESSOR_CACHE_SIZE)
+def _parse_headers(content: str) -> Tuple[Header, ...]:
+    """Extract ATX headers from content (cached per content)."""
+    # One multiline finditer pass; line numbers come from a running
+    # newline count between matches, as in the Mermaid fence scan
+    headers = []
+    line = 0
+    pos = 0
+
+    for match in _HEADER_RE.finditer(content):
+        line += content.count('\n', pos, match.start())
+        pos = match.start()
+        headers.append(Header(
+            level=len(match.group(1)),
+            title=match.group(2).strip(),
+            line_number=line
+        ))
+
+    return tuple(headers)
+
+
+@lru_cache(maxsize=PROCESSOR_CACHE_SIZE)
+def _convert_to_html(content: str) -> str:
+    """Convert markdown to HTML with Mermaid support (cached per content)."""
+    mermaid_blocks = _detect_mermaid_blocks(content)
+
+    if not mermaid_blocks:
+        # No Mermaid blocks, just convert normally
+        return render_html(content)
+
+    # Replace each block with a Mermaid div by slicing at the block
+    # offsets, avoiding the split/join copy of the whole document
+    parts = []
+    cursor = 0
+
+    for block in mermaid_blocks:
+        parts.append(content[cursor:block.start_offset])
+        parts.append(f'<div class="mermaid">\n{block.content}\n</div>')
+        cursor = block.end_offset
+
+    parts.append(content[cursor:])
+
+    # Convert the processed markdown to HTML
+    return render_html(''.join(parts))
 
 
 class MarkdownProcessor:
     """Handles markdown processing operations."""
-    
+
     def __init__(self):
         self.mermaid_blocks: MermaidBlockList = []
-    
+
     def detect_mermaid_blocks(self, content: str) -> MermaidBlockList:
         """
         Detect Mermaid diagram blocks in the markdown content.
-        
+
         Args:
             content: The markdown content to process
-            
+
         Returns:
             List of MermaidBlock objects
         """
-        mermaid_blocks = []
-        lines = content.split('\n')
-        in_mermaid_block = False
-        block_start = -1
-        block_content = []
-        
-        for i, line in enumerate(lines):
-            if line.strip().startswith('```mermaid'):
-                in_mermaid_block = True
-                block_start = i
-                block_content = []
-            elif in_mermaid_block and line.strip() == '```':
-                in_mermaid_block = False
-                mermaid_blocks.append(MermaidBlock(
-                    start_line=block_start,
-                    end_line=i,
-                    content='\n'.join(block_content)
-                ))
-            elif in_mermaid_block:
-                block_content.append(line)
-        
-        self.mermaid_blocks = mermaid_blocks
-        return mermaid_blocks
-    
+        self.mermaid_blocks = list(_detect_mermaid_blocks(content))
+        return self.mermaid_blocks
+
     def process_with_mermaid(self, content: str) -> str:
         """
         Process markdown content to handle Mermaid diagrams.
-        
+
         Args:
             content: The markdown content to process
-            
+
         Returns:
             Processed markdown with Mermaid placeholders
         """
         self.detect_mermaid_blocks(content)
-        
-        if not self.mermaid_blocks:
-            return content
-        
-        lines = content.split('\n')
-        processed_lines = []
-        current_line = 0
-        
-        for block in self.mermaid_blocks:
-            # Add lines before the Mermaid block
-            processed_lines.extend(lines[current_line:block.start_line])
-            
-            # Add a placeholder for the Mermaid diagram
-            processed_lines.append('```')
-            processed_lines.append('╔══════════════════════════════════════╗')
-            processed_lines.append('║        MERMAID DIAGRAM               ║')
-            processed_lines.append('║                                      ║')
-            processed_lines.append('║  [View in browser with "o" key]      ║')
-            processed_lines.append('║                                      ║')
-            
-            # Add a preview of the Mermaid content
-            preview_lines = block.content.strip().split('\n')[:MERMAID_PREVIEW_LINES]
-            for line in preview_lines:
-                if len(line) > MERMAID_PREVIEW_MAX_LENGTH:
-                    line = line[:MERMAID_PREVIEW_MAX_LENGTH - 3] + '...'
-                processed_lines.append(f'║  {line:<36} ║')
-            
-            if len(preview_lines) < len(block.content.strip().split('\n')):
-                processed_lines.append('║  ...                                 ║')
-            
-            processed_lines.append('╚══════════════════════════════════════╝')
-            processed_lines.append('```')
-            
-            current_line = block.end_line + 1
-        
-        # Add remaining lines
-        processed_lines.extend(lines[current_line:])
-        
-        result = '\n'.join(processed_lines)
-        return result
-    
+        return _process_with_mermaid(content)
+
     def parse_headers(self, content: str) -> HeaderList:
         """
         Parse markdown content to extract headers.
-        
+
         Args:
             content: The markdown content to parse
-            
+
         Returns:
             List of Header objects
         """
-        headers = []
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines):
-            # Check for ATX-style headers (# Header)
-            match = re.match(r'^(#{1,6})\s+(.+)', line.strip())
-            if match:
-                level = len(match.group(1))
-                title = match.group(2).strip()
-                headers.append(Header(
-                    level=level,
-                    title=title,
-                    line_number=line_num
-                ))
-        
-        return headers
-    
+        return list(_parse_headers(content))
+
     def convert_to_html(self, content: str) -> str:
         """
         Convert markdown to HTML with Mermaid diagram support.
-        
+
         Args:
             content: The markdown content to convert
-            
+
         Returns:
             HTML string
         """
         self.detect_mermaid_blocks(content)
-        
-        if not self.mermaid_blocks:
-            # No Mermaid blocks, just convert normally
-            return markdown(content)
-        
-        # Process markdown with Mermaid blocks
-        lines = content.split('\n')
-        processed_lines = []
-        current_line = 0
-        
-        for block in self.mermaid_blocks:
-            # Add lines before the Mermaid block
-            processed_lines.extend(lines[current_line:block.start_line])
-            
-            # Add Mermaid div
-            processed_lines.append(f'<div class="mermaid">')
-            processed_lines.append(block.content)
-            processed_lines.append('</div>')
-            
-            current_line = block.end_line + 1
-        
-        # Add remaining lines
-        processed_lines.extend(lines[current_line:])
-        
-        # Convert the processed markdown to HTML
-        processed_markdown = '\n'.join(processed_lines)
-        return markdown(processed_markdown) 
\ No newline at end of file
+        return _convert_to_html(content)
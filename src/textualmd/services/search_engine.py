@@ -3,8 +3,16 @@ Service for handling search functionality within markdown documents.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Tuple, Optional
 from ..app_types import SearchResults
+from ..constants import SEARCH_RESULTS_CAP
+
+
+@lru_cache(maxsize=64)
+def _compile_term(term: str) -> 're.Pattern[str]':
+    """Compile an escaped, case-insensitive pattern for a literal term."""
+    return re.compile(re.escape(term), re.IGNORECASE)
 
 
 class SearchEngine:
@@ -14,31 +22,114 @@ class SearchEngine:
         self.search_results: SearchResults = []
         self.current_index = 0
         self.search_term = ""
-    
+        # Cache of the previous scan, used to filter instead of rescanning
+        # when the user extends the term while typing. The starts list
+        # holds every match position including overlapping ones — the
+        # reported results are non-overlapping, but a longer term can
+        # match at a start the shorter term's report skipped, so only
+        # the full set filters exactly. None means the previous scan
+        # went through the regex path and cannot be reused.
+        self._last_term = ""
+        self._last_starts: Optional[List[int]] = None
+        self._last_content_hash: Optional[int] = None
+        # When the previous scan stopped at the cap, later matches are
+        # unknown and the prefix filter cannot be trusted
+        self._last_capped = False
+        self._lowered_cache: Optional[Tuple[int, Optional[str]]] = None
+
+    def _lowered_content(self, content: str, content_hash: int) -> Optional[str]:
+        """
+        Get a lowercased copy of the content for literal matching.
+
+        Returns None when lowercasing changes the string length (rare
+        non-ASCII case mappings), in which case offsets would not line up
+        and the regex path must be used instead.
+        """
+        if self._lowered_cache is None or self._lowered_cache[0] != content_hash:
+            lowered = content.lower()
+            if len(lowered) != len(content):
+                lowered = None
+            self._lowered_cache = (content_hash, lowered)
+        return self._lowered_cache[1]
+
     def search(self, content: str, search_term: str) -> SearchResults:
         """
         Perform a case-insensitive search in the content.
-        
+
         Args:
             content: The text content to search in
             search_term: The term to search for
-            
+
         Returns:
             List of (start, end) tuples for match positions
         """
         if not search_term:
-            self.search_results = []
-            self.current_index = 0
-            self.search_term = ""
+            self.clear()
             return []
-        
+
         self.search_term = search_term
-        pattern = re.escape(search_term)
-        matches = list(re.finditer(pattern, content, re.IGNORECASE))
-        
-        self.search_results = [(m.start(), m.end()) for m in matches]
+        content_hash = hash(content)
+        lowered_term = search_term.lower()
+        term_len = len(search_term)
+        lowered = self._lowered_content(content, content_hash)
+        use_literal = lowered is not None and len(lowered_term) == term_len
+
+        if (
+            use_literal
+            and content_hash == self._last_content_hash
+            and self._last_starts is not None
+            and self._last_term
+            and not self._last_capped
+            and lowered_term.startswith(self._last_term.lower())
+        ):
+            # The new term extends the previous one, so every match must
+            # start at a previously recorded start: filter the complete
+            # start set instead of rescanning the document
+            starts = [
+                s for s in self._last_starts
+                if lowered.startswith(lowered_term, s)
+            ]
+            results = []
+            prev_end = 0
+            for s in starts:
+                if s >= prev_end:
+                    results.append((s, s + term_len))
+                    prev_end = s + term_len
+        elif use_literal:
+            # Literal fast path: C-level str.find on the pre-lowered
+            # haystack is much faster than the regex engine. Every start
+            # is recorded (overlapping ones included) for the prefix
+            # filter above; the reported results skip overlaps, exactly
+            # like a scan that resumes past each accepted match.
+            starts = []
+            results = []
+            prev_end = 0
+            find = lowered.find
+            pos = find(lowered_term)
+            while pos != -1:
+                starts.append(pos)
+                if pos >= prev_end:
+                    results.append((pos, pos + term_len))
+                    if len(results) >= SEARCH_RESULTS_CAP:
+                        break
+                    prev_end = pos + term_len
+                pos = find(lowered_term, pos + 1)
+        else:
+            starts = None
+            results = []
+            for m in _compile_term(search_term).finditer(content):
+                results.append((m.start(), m.end()))
+                if len(results) >= SEARCH_RESULTS_CAP:
+                    break
+
+        self._last_term = search_term
+        self._last_starts = starts
+        self._last_content_hash = content_hash
+        self._last_capped = len(results) >= SEARCH_RESULTS_CAP
+
+        self.search_results = results
         self.current_index = 0 if self.search_results else -1
-        
+
         return self.search_results
     
     def next_result(self) -> Optional[int]:
@@ -100,7 +191,12 @@ class SearchEngine:
         self.search_results = []
         self.current_index = 0
         self.search_term = ""
-    
+        self._last_term = ""
+        self._last_starts = None
+        self._last_content_hash = None
+        self._last_capped = False
+        self._lowered_cache = None
+
     def calculate_line_number(self, content: str, position: int) -> int:
         """
         Calculate the line number for a given position in the content.
@@ -112,4 +208,6 @@ class SearchEngine:
         Returns:
             Zero-based line number
         """
-        return content[:position].count('\n') 
\ No newline at end of file
+        # Bounded count scans in place; slicing first would copy the
+        # whole prefix just to throw it away
+        return content.count('\n', 0, position) 
\ No newline at end of file
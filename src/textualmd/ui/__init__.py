@@ -4,10 +4,13 @@ UI package for the Markdown Viewer application.
 
 from .styles import APP_CSS
 from .bindings import APP_BINDINGS
-from .widgets import UIHelper
+from .widgets import MarkdownTree, UIHelper, CURRENT_MATCH_STYLE, coalesce_matches
 
 __all__ = [
     'APP_CSS',
     'APP_BINDINGS',
-    'UIHelper'
+    'MarkdownTree',
+    'UIHelper',
+    'CURRENT_MATCH_STYLE',
+    'coalesce_matches'
 ] 
\ No newline at end of file
@@ -3,10 +3,11 @@ Key bindings configuration for the Markdown Viewer application.
 """
 
 from textual.binding import Binding
-from typing import List
+from typing import Final, Tuple
 
-# Define all application key bindings
-APP_BINDINGS: List[Binding] = [
+# Define all application key bindings; a tuple keeps the table immutable
+# and shareable across screens
+APP_BINDINGS: Final[Tuple[Binding, ...]] = (
     Binding("d", "toggle_dark", "Dark mode", show=True),
     Binding("r", "toggle_raw", "Raw/Rendered", show=True),
     Binding("o", "open_browser", "Open in browser", show=True),
@@ -15,4 +16,4 @@ APP_BINDINGS: List[Binding] = [
     Binding("s", "toggle_search", "Search", show=True),
     Binding("e", "export_file", "Export", show=True),
     Binding("q", "quit", "Quit", show=True)
-] 
\ No newline at end of file
+)
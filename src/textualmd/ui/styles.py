@@ -2,9 +2,13 @@
 CSS styles for the Markdown Viewer application.
 """
 
+from typing import Final
+
 from ..constants import FILE_TREE_WIDTH, TOC_PANEL_WIDTH
 
-APP_CSS = f"""
+# Interpolated once at import; the module cache means re-imports are a
+# dict lookup, not a rebuild
+APP_CSS: Final[str] = f"""
 Screen {{
     background: $surface;
 }}
@@ -2,11 +2,72 @@
 UI widgets and helper functions for the Markdown Viewer application.
 """
 
-from textual.widgets import Tree
-from typing import List, Optional
-from rich.text import Text
-from rich.markup import escape
+from pathlib import Path
+from textual.widgets import DirectoryTree, Tree
+from typing import Iterable, List, Optional, Tuple
+from rich.style import Style
+from rich.text import Span, Text
 from ..app_types import HeaderList, SearchResults
+from ..constants import MARKDOWN_EXTENSIONS
+
+# Pre-parsed highlight styles; Style.parse runs Rich's style tokenizer,
+# so parsing once here keeps it out of the per-match loop
+CURRENT_MATCH_STYLE = Style.parse("bold yellow on dark_orange")
+OTHER_MATCH_STYLE = Style.parse("black on yellow")
+
+
+class MarkdownTree(DirectoryTree):
+    """A DirectoryTree that only shows directories and markdown files.
+
+    Filtering at the tree level keeps Textual from allocating node
+    objects for the (usually much larger) set of irrelevant files.
+    """
+
+    def filter_paths(self, paths: Iterable[Path]) -> Iterable[Path]:
+        # Check the raw suffix first: it is almost always lowercase, and
+        # skipping .lower() avoids an allocation per directory entry
+        return [
+            path for path in paths
+            if path.is_dir()
+            or path.suffix in MARKDOWN_EXTENSIONS
+            or path.suffix.lower() in MARKDOWN_EXTENSIONS
+        ]
+
+
+def coalesce_matches(
+    search_results: SearchResults,
+    current_index: int
+) -> Tuple[SearchResults, int]:
+    """
+    Drop overlapping or out-of-order (start, end) ranges, remapping the
+    current index onto the kept list.
+
+    The search engine emits sorted, non-overlapping matches, so the
+    common case is a single verification sweep returning the input
+    untouched; only pathological inputs pay for the sort and filter.
+    """
+    prev_end = -1
+    for start, end in search_results:
+        if start < prev_end:
+            break
+        prev_end = end
+    else:
+        return search_results, current_index
+
+    order = sorted(range(len(search_results)), key=lambda i: search_results[i])
+    kept: SearchResults = []
+    new_current = -1
+    prev_end = -1
+    for i in order:
+        start, end = search_results[i]
+        if start < prev_end:
+            continue
+        if i == current_index:
+            new_current = len(kept)
+        kept.append((start, end))
+        prev_end = end
+
+    return kept, new_current
 
 
 class UIHelper:
@@ -27,57 +88,77 @@ class UIHelper:
             tree.root.add_leaf("No headers found")
             return
         
-        # Build tree structure based on header levels
-        node_stack = [(0, tree.root)]  # (level, node)
-        
+        # Build tree structure based on header levels. Parallel stacks
+        # keep the pop loop a bare int compare instead of indexing into
+        # (level, node) tuples per step
+        levels = [0]
+        nodes = [tree.root]
+
         for header in headers:
             level = header.level
-            title = header.title
-            line = header.line_number
-            
-            # Find the appropriate parent node
-            while node_stack and node_stack[-1][0] >= level:
-                node_stack.pop()
-            
+
+            # Find the appropriate parent node; the root sentinel at
+            # level 0 can never be popped
+            while levels[-1] >= level:
+                levels.pop()
+                nodes.pop()
+
             # Add the new node
-            parent_node = node_stack[-1][1] if node_stack else tree.root
-            new_node = parent_node.add(title, data=line)
-            
+            new_node = nodes[-1].add(header.title, data=header.line_number)
+
             # Add to stack for potential children
-            node_stack.append((level, new_node))
+            levels.append(level)
+            nodes.append(new_node)
         
         # Expand the root to show the TOC
         tree.root.expand()
     
     @staticmethod
     def create_highlighted_text(
-        content: str, 
-        search_results: SearchResults, 
-        current_index: int
+        content: str,
+        search_results: SearchResults,
+        current_index: int,
+        base: Optional[Text] = None,
+        window: Optional[Tuple[int, int]] = None
     ) -> Text:
         """
         Create a Rich Text object with search highlights.
-        
+
         Args:
             content: The text content
             search_results: List of (start, end) tuples
             current_index: Index of the current search result
-            
+            base: Optional pre-built Text to style a copy of (avoids re-escaping)
+            window: Optional (start, end) character range; only matches inside
+                the window are styled (the current match is always styled)
+
         Returns:
             Rich Text object with highlighting
         """
-        # Create a Rich Text object with the escaped content
-        text = Text(escape(content))
-        
-        # Apply highlighting to all matches
+        # Reuse the pre-built Text when available; Text() treats the content
+        # as literal so the (start, end) offsets always line up
+        if base is not None:
+            text = base.copy()
+        else:
+            text = Text(content)
+
+        search_results, current_index = coalesce_matches(
+            search_results, current_index
+        )
+
+        # Collect the highlight spans in one pass and attach the list
+        # wholesale; per-match stylize calls each mutate the span list
+        spans = []
         for i, (start, end) in enumerate(search_results):
             if i == current_index:
                 # Current match - use orange background
-                text.stylize("bold yellow on dark_orange", start, end)
-            else:
+                spans.append(Span(start, end, CURRENT_MATCH_STYLE))
+            elif window is None or window[0] <= start < window[1]:
                 # Other matches - use yellow background
-                text.stylize("black on yellow", start, end)
-        
+                spans.append(Span(start, end, OTHER_MATCH_STYLE))
+        if spans:
+            text.spans = [*text.spans, *spans]
+
         return text
     
     @staticmethod
@@ -99,34 +180,29 @@ class UIHelper:
         """
         if not search_results:
             return content
-        
-        highlighted_content = content
-        
-        # Sort results by position in reverse order to avoid offset issues
-        sorted_results = sorted(
-            enumerate(search_results), 
-            key=lambda x: x[1][0], 
-            reverse=True
+
+        search_results, current_index = coalesce_matches(
+            search_results, current_index
         )
-        
-        # Apply visual highlighting with unicode characters
-        for i, (start, end) in sorted_results:
-            match_text = highlighted_content[start:end]
-            
+
+        # Single linear sweep: collect slices and markers, then join once.
+        # Rebuilding the string per match would be O(content x matches).
+        parts = []
+        prev_end = 0
+        for i, (start, end) in enumerate(search_results):
+            parts.append(content[prev_end:start])
+            match_text = content[start:end]
+
             if i == current_index:
                 # Current match - use distinctive markers
-                replacement = f'【{match_text}】'
+                parts.append(f'【{match_text}】')
             else:
                 # Other matches - use lighter markers
-                replacement = f'〖{match_text}〗'
-            
-            highlighted_content = (
-                highlighted_content[:start] + 
-                replacement + 
-                highlighted_content[end:]
-            )
-        
-        return highlighted_content
+                parts.append(f'〖{match_text}〗')
+            prev_end = end
+        parts.append(content[prev_end:])
+
+        return ''.join(parts)
     
     @staticmethod
     def generate_search_status(